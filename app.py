@@ -40,6 +40,7 @@ class RunOptions:
     seed: Optional[int] = None
     tracker_format: str = "block"
     head: str = "none"
+    realtime_priority: bool = False
 
 
 class InfiniteJazzApp:
@@ -166,6 +167,7 @@ class InfiniteJazzApp:
             prompt_builder_factory=prompt_builder_factory,
             tracker_format=self.run_options.tracker_format,
             chart=chart,
+            realtime_priority=self.run_options.realtime_priority,
         )
 
         generator.run(num_sections=self.run_options.num_sections)
@@ -5,11 +5,12 @@ Designed for easy backend swapping
 """
 
 import mido
+import os
 import time
 import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import List, Optional
-from queue import Queue, Empty
 
 
 class AudioBackend(ABC):
@@ -107,7 +108,6 @@ class FluidSynthBackend(AudioBackend):
             )
 
             # Give it a moment to start
-            import time
             time.sleep(0.5)
 
             # Check if it's still running
@@ -228,33 +228,73 @@ class VirtualMIDIBackend(AudioBackend):
             self.port.close()
 
 
+# SCHED_FIFO priority for MIDI timing threads (1-99; leave headroom for audio drivers)
+REALTIME_PRIORITY = 50
+
+
+def enable_realtime_scheduling(priority: int = REALTIME_PRIORITY) -> bool:
+    """
+    Best-effort switch of the calling thread to SCHED_FIFO (Linux only)
+    Args:
+        priority: SCHED_FIFO priority (1-99)
+    Returns:
+        True if realtime scheduling is now active; False after printing a warning
+    """
+    if not hasattr(os, 'sched_setscheduler'):
+        print("Warning: realtime scheduling is not supported on this platform")
+        return False
+    try:
+        # pid 0 targets the calling thread on Linux
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except OSError as exc:
+        print(
+            f"Warning: could not enable realtime scheduling ({exc}). "
+            "Grant CAP_SYS_NICE or raise the rtprio limit for this user."
+        )
+        return False
+    return True
+
+
 class RealtimePlayer:
     """
     Real-time MIDI player with buffering
     Plays MIDI messages with precise timing
     """
 
-    def __init__(self, backend: AudioBackend):
+    def __init__(self, backend: AudioBackend, realtime_priority: bool = False):
         """
         Initialize realtime player
         Args:
             backend: AudioBackend instance
+            realtime_priority: Try to run the playback thread under SCHED_FIFO
+                               so LLM work on other cores cannot preempt it
         """
         self.backend = backend
-        self.message_queue = Queue()
+        self.realtime_priority = realtime_priority
+        # The playback thread is recreated after every underrun; only try
+        # (and warn about) SCHED_FIFO once per player
+        self._rt_priority_failed = False
+        # Single producer (scheduler) / single consumer (playback thread):
+        # deque append/popleft are atomic, so no Queue mutex is needed.
+        self.message_queue = deque()
+        self._items_event = threading.Event()
+        self._stop_event = threading.Event()
         self.is_playing = False
         self.player_thread = None
 
-    def schedule_messages(self, messages: List[tuple]):
+    def schedule_messages(self, messages: List[tuple], presorted: bool = False):
         """
         Schedule MIDI messages for playback
         Args:
             messages: List of (time_in_seconds, mido.Message) tuples
+            presorted: Skip sorting when messages are already in time order
+                       (e.g. straight from MIDIConverter.create_realtime_messages)
         """
         # ensure monotonically increasing schedule
-        messages = sorted(messages, key=lambda item: item[0])
-        for msg in messages:
-            self.message_queue.put(msg)
+        if not presorted:
+            messages = sorted(messages, key=lambda item: item[0])
+        self.message_queue.extend(messages)
+        self._items_event.set()
 
     def play(self):
         """Start playback in separate thread"""
@@ -263,36 +303,51 @@ class RealtimePlayer:
             return
 
         self.is_playing = True
+        self._stop_event.clear()
         self.player_thread = threading.Thread(target=self._playback_loop)
         self.player_thread.start()
 
+    def _raise_thread_priority(self):
+        """Switch the playback thread to SCHED_FIFO unless a previous attempt failed."""
+        if not self._rt_priority_failed:
+            self._rt_priority_failed = not enable_realtime_scheduling()
+
     def _playback_loop(self):
         """Main playback loop (runs in separate thread)"""
-        start_time = time.time()
+        if self.realtime_priority:
+            self._raise_thread_priority()
+
+        # Monotonic clock: immune to NTP/wall-clock jumps during long sessions
+        start_ns = time.monotonic_ns()
+        last_time = None
 
         while self.is_playing:
             try:
-                # Get next message with timeout
-                scheduled_time, message = self.message_queue.get(timeout=0.1)
-
-                # Wait until scheduled time
-                current_time = time.time() - start_time
-                wait_time = scheduled_time - current_time
+                scheduled_time, message = self.message_queue.popleft()
+            except IndexError:
+                # Wait briefly for more messages; stop once the queue stays dry
+                if not self._items_event.wait(timeout=0.1):
+                    self.is_playing = False
+                    break
+                self._items_event.clear()
+                continue
 
-                if wait_time < -0.1:
-                    # message schedule was already in the past; treat as drift and send immediately
-                    wait_time = 0
+            # Events sharing the previous deadline (chords, program changes)
+            # are already due: send them without touching the clock
+            if last_time is None or scheduled_time > last_time:
+                last_time = scheduled_time
 
-                if wait_time > 0:
-                    time.sleep(wait_time)
+                # Wait until the absolute deadline for this message
+                deadline_ns = start_ns + int(scheduled_time * 1e9)
+                wait_ns = deadline_ns - time.monotonic_ns()
 
-                # Send message
-                self.backend.send_message(message)
+                # Sleep on the stop event so stop() interrupts a pending wait;
+                # late messages (including drifted ones) are sent immediately
+                if wait_ns > 0 and self._stop_event.wait(wait_ns / 1e9):
+                    break
 
-            except Empty:
-                # No more messages, stop playing
-                self.is_playing = False
-                break
+            # Send message
+            self.backend.send_message(message)
 
     def wait_until_done(self):
         """Block until the playback thread finishes naturally (queue drained)."""
@@ -302,15 +357,13 @@ class RealtimePlayer:
     def stop(self):
         """Stop playback"""
         self.is_playing = False
+        self._stop_event.set()
         if self.player_thread:
             self.player_thread.join()
 
         # Clear remaining messages
-        while not self.message_queue.empty():
-            try:
-                self.message_queue.get_nowait()
-            except Empty:
-                break
+        self.message_queue.clear()
+        self._items_event.clear()
 
     def close(self):
         """Clean up resources"""
@@ -325,8 +378,6 @@ def play_midi_file(midi_file: mido.MidiFile, backend: AudioBackend):
         midi_file: mido.MidiFile object
         backend: AudioBackend instance
     """
-    import time
-
     print(f"Playing MIDI file with {len(midi_file.tracks)} tracks...")
 
     # Give FluidSynth a moment to warm up before playing
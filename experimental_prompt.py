@@ -1,14 +1,13 @@
 """Prompt builders for Infinite Jazz batched quartet generation - Improved version."""
 
 from dataclasses import dataclass
-from typing import List
 import random
 
 from config import RuntimeConfig
 
 
-EXAMPLE_SNIPPET: List[str] = [
-    "FORMAT EXAMPLE:",
+# Format example body; each prompt supplies its own heading line
+EXAMPLE_SNIPPET: str = "\n".join((
     "BASS",
     "1 C2:80",
     "2 .",
@@ -32,11 +31,11 @@ EXAMPLE_SNIPPET: List[str] = [
     "2 .",
     "3 B4:90",
     "4 ^",
-]
+))
 
 
 # Rotating prompts to vary the generative approach
-EXPLORATION_MODES = [
+EXPLORATION_MODES = (
     "CONVERSATION MODE: Each instrument should respond to or comment on what another just played, like a musical dialogue.",
     "TENSION MODE: Build harmonic or rhythmic tension gradually, then release it unexpectedly.",
     "SPACE MODE: Use silence strategically. At least one instrument should leave significant gaps.",
@@ -45,9 +44,9 @@ EXPLORATION_MODES = [
     "MOMENTUM MODE: Create forward motion through walking bass, driving rhythm, or ascending melodic lines.",
     "FRAGMENT MODE: Trade short musical phrases between instruments, breaking up longer lines.",
     "TEXTURE MODE: Contrast sparse and dense moments. Some instruments drop out while others become busier.",
-]
+)
 
-DYNAMIC_CONSTRAINTS = [
+DYNAMIC_CONSTRAINTS = (
     "One instrument must play a repeated figure with slight variations each time.",
     "Include at least one moment where all instruments hit the same beat, then scatter.",
     "The sax should leave a dramatic pause of at least 4 steps somewhere.",
@@ -56,7 +55,7 @@ DYNAMIC_CONSTRAINTS = [
     "Drums accent unexpected beats while keeping time subtly.",
     "Create a call-and-response between any two instruments.",
     "All instruments should crescendo or decrescendo together at some point.",
-]
+)
 
 
 @dataclass
@@ -121,7 +120,7 @@ class PromptBuilder:
 
         prompt.append("")
         prompt.append("EXACT FORMAT EXAMPLE (your notes/rhythms must differ):")
-        prompt.extend(EXAMPLE_SNIPPET[1:])  # Skip "FORMAT EXAMPLE:" line since we have our own
+        prompt.append(EXAMPLE_SNIPPET)
 
         prompt.extend([
             "",
@@ -2,14 +2,27 @@
 
 from typing import Dict, Optional, Callable
 import re
+import threading
 import time
 
 from llm_interface import LLMInterface
 from prompts import PromptBuilder
-from tracker_parser import parse_tracker, parse_interleaved, InstrumentTrack, TrackerStep, TrackerParser
+from tracker_parser import parse_tracker, parse_interleaved, InstrumentTrack, TrackerStep, TrackerParser, _CODE_FENCE_RE
 from config import RuntimeConfig
 
 
+# Output-cleaning patterns for LLM responses (code fences: tracker_parser._CODE_FENCE_RE)
+# Instrument header lines in batched output ("BASS", "DRUMS", ...)
+_SECTION_HEADER_RE = re.compile(r'^(BASS|DRUMS|PIANO|SAX)\s*$', re.MULTILINE)
+_BOLD_HEADER_RE = re.compile(r'\*\*([A-Z]+)\*\*')
+_HEADER_LINE_RE = re.compile(r'^(BASS|DRUMS|PIANO|SAX)\s*\n?', re.MULTILINE)
+_LINE_NUMBER_RE = re.compile(r'^\d+\.?\s+', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_TRAILING_COMMENT_RE = re.compile(r'\s+[(\[#]|//|--')
+# NOTE:VELOCITY or chord; trailing junk in velocity is cleaned by the parser
+_NOTE_LINE_RE = re.compile(r'^[A-G][#b]?-?\d+:\d+[^,]*(?:,[A-G][#b]?-?\d+:\d+[^,]*)*$')
+
+
 class GenerationPipeline:
     """Generation pipeline for jazz quartet (batched-only generation)"""
 
@@ -341,30 +354,32 @@ class GenerationPipeline:
         generated_text = {}
 
         # Remove markdown formatting
-        cleaned = re.sub(r'\*\*([A-Z]+)\*\*', r'\1', raw_output)
-        cleaned = re.sub(r'```[\w]*\n?', '', cleaned)
+        cleaned = _BOLD_HEADER_RE.sub(r'\1', raw_output)
+        cleaned = _CODE_FENCE_RE.sub('', cleaned)
+
+        # One scan for all instrument headers; keep each one's first occurrence
+        headers = {}
+        for match in _SECTION_HEADER_RE.finditer(cleaned):
+            headers.setdefault(match.group(1), match)
 
         # Split by instrument headers
         for i, instrument in enumerate(self.GENERATION_ORDER):
             # Find this instrument's section
-            pattern = rf'^{instrument}\s*$'
-            matches = list(re.finditer(pattern, cleaned, re.MULTILINE))
+            header = headers.get(instrument)
 
-            if not matches:
+            if header is None:
                 if self.verbose:
                     print(f"  Warning: Could not find {instrument} section in output")
                 generated_text[instrument] = '.' * self.config.total_steps
                 continue
 
             # Get content between this instrument and the next
-            start = matches[0].end()
+            start = header.end()
 
             # Find where this section ends (next instrument header or end of text)
             if i < len(self.GENERATION_ORDER) - 1:
-                next_instrument = self.GENERATION_ORDER[i + 1]
-                next_pattern = rf'^{next_instrument}\s*$'
-                next_matches = list(re.finditer(next_pattern, cleaned, re.MULTILINE))
-                end = next_matches[0].start() if next_matches else len(cleaned)
+                next_header = headers.get(self.GENERATION_ORDER[i + 1])
+                end = next_header.start() if next_header else len(cleaned)
             else:
                 end = len(cleaned)
 
@@ -391,14 +406,14 @@ class GenerationPipeline:
         - Normalize unicode musical symbols
         """
         # Remove markdown code blocks
-        text = re.sub(r'```[\w]*\n?', '', text)
+        text = _CODE_FENCE_RE.sub('', text)
 
         # Remove section headers (BASS, DRUMS, etc.)
-        text = re.sub(r'^(BASS|DRUMS|PIANO|SAX)\s*\n?', '', text, flags=re.MULTILINE)
+        text = _HEADER_LINE_RE.sub('', text)
 
         # Remove line numbers (format: "1 C2:80" or "1. C2:80" -> "C2:80")
         # Handle both "1 " and "1. " formats (LLMs often add periods)
-        text = re.sub(r'^\d+\.?\s+', '', text, flags=re.MULTILINE)
+        text = _LINE_NUMBER_RE.sub('', text)
 
         # Normalize unicode musical symbols to ASCII equivalents
         # ♯ (U+266F) -> #
@@ -409,7 +424,7 @@ class GenerationPipeline:
         text = text.strip()
 
         # Ensure consistent line breaks
-        text = re.sub(r'\n\s*\n', '\n', text)
+        text = _BLANK_LINES_RE.sub('\n', text)
 
         return text
 
@@ -448,7 +463,7 @@ class GenerationPipeline:
 
             # Strip trailing comments/explanations (LLMs love to explain themselves)
             # Remove anything after: parentheses, #, //, --, etc.
-            line = re.split(r'\s+[(\[#]|//|--', line)[0].strip()
+            line = _TRAILING_COMMENT_RE.split(line, 1)[0].strip()
 
             # Validate note format
             try:
@@ -473,9 +488,7 @@ class GenerationPipeline:
         line_clean = line.strip().rstrip('.,;')
 
         # Check for note:velocity or chord format
-        # Allow trailing junk in velocity that will be cleaned by parser
-        pattern = r'^[A-G][#b]?-?\d+:\d+[^,]*(?:,[A-G][#b]?-?\d+:\d+[^,]*)*$'
-        return bool(re.match(pattern, line_clean))
+        return _NOTE_LINE_RE.match(line_clean) is not None
 
     def _assemble_tracker(self, generated_text: Dict[str, str]) -> str:
         """
@@ -560,8 +573,6 @@ class ContinuousGenerator:
             tracker_format: "block" or "interleaved"
             chart: Optional ChordChart for harmonic anchoring
         """
-        import threading
-
         self.config = runtime_config
         self.pipeline = GenerationPipeline(
             llm,
@@ -577,6 +588,9 @@ class ContinuousGenerator:
         self.buffer_size = buffer_size
         self.buffer = []
         self.generation_lock = threading.Lock()
+        # Set while a section is buffered (or background generation has finished
+        # with an error), so consumers can block instead of polling
+        self.section_ready = threading.Event()
         self.generation_thread = None
         self.last_generation_error = None
         self.verbose = verbose
@@ -595,6 +609,7 @@ class ContinuousGenerator:
             section = self.pipeline.generate_section(context)
 
             self.buffer.append(section)
+            self.section_ready.set()
             if self.verbose:
                 print(f"\nBuffered section {i+1}/{target}")
 
@@ -619,6 +634,8 @@ class ContinuousGenerator:
         # Pop from buffer
         with self.generation_lock:
             section = self.buffer.pop(0)
+            if not self.buffer:
+                self.section_ready.clear()
 
         # Start generating new section in background when more sections are needed
         if continue_buffering:
@@ -628,8 +645,6 @@ class ContinuousGenerator:
 
     def _start_background_generation(self):
         """Start generating a new section in the background"""
-        import threading
-
         # Only start if no generation is already happening
         if self.generation_thread is not None and self.generation_thread.is_alive():
             return
@@ -640,53 +655,56 @@ class ContinuousGenerator:
                 new_section = self.pipeline.generate_section(context)
                 with self.generation_lock:
                     self.buffer.append(new_section)
+                    self.section_ready.set()
                 self.last_generation_error = None
             except Exception as exc:
                 self.last_generation_error = exc
                 if self.verbose:
                     print(f"Background generation error: {exc}")
+                # Wake any waiter so get_next_section can surface the error
+                self.section_ready.set()
 
         self.generation_thread = threading.Thread(target=generate)
         self.generation_thread.daemon = True
         self.generation_thread.start()
 
+    def wait_for_section(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a section is buffered or background generation has failed
+
+        Returns:
+            True if woken by the generator, False on timeout
+        """
+        return self.section_ready.wait(timeout)
+
+    def is_generating(self) -> bool:
+        """Check if a background generation is in progress"""
+        return self.generation_thread is not None and self.generation_thread.is_alive()
+
     def has_buffered_sections(self) -> bool:
         """Check if buffer has sections"""
         return len(self.buffer) > 0
 
 
-def concatenate_sections(sections_list: list) -> Dict[str, InstrumentTrack]:
+def append_section(combined: Dict[str, InstrumentTrack], section: Dict[str, InstrumentTrack]):
     """
-    Concatenate multiple sections into one long track set
+    Append one section's steps onto a running combined track set (in place)
 
-    Args:
-        sections_list: List of track dicts (each from generate_section)
+    Used to build one long track set from many sections; callers can drop
+    each section as soon as it has been appended.
 
-    Returns:
-        Single track dict with all sections concatenated
+    Args:
+        combined: Running track dict to extend
+        section: Track dict for the next section (from generate_section)
     """
-    if not sections_list:
-        return {}
-
-    # Start with empty tracks for each instrument
-    combined = {}
-
     for instrument in GenerationPipeline.GENERATION_ORDER:
-        all_steps = []
-
-        # Concatenate steps from each section
-        for section in sections_list:
-            if instrument in section:
-                all_steps.extend(section[instrument].steps)
-
-        # Create combined track
-        if all_steps:
-            combined[instrument] = InstrumentTrack(
-                instrument=instrument,
-                steps=all_steps
-            )
-
-    return combined
+        if instrument not in section:
+            continue
+        track = combined.get(instrument)
+        if track is None:
+            # Fresh list so later extends never mutate the section's own steps
+            track = combined[instrument] = InstrumentTrack(instrument=instrument, steps=[])
+        track.steps.extend(section[instrument].steps)
 
 
 def save_generated_section(
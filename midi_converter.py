@@ -22,6 +22,8 @@ class MIDIConverter:
         self.config = runtime_config
         self.tempo = tempo or runtime_config.tempo
         self.ticks_per_step = runtime_config.ticks_per_step
+        # Seconds per 16th-note step; tempo is fixed for the converter's lifetime
+        self.seconds_per_step = 1.0 / (self.tempo / 60.0 * 4)
         # Allow override of drum translation
         self.translate_drums = translate_drums if translate_drums is not None else runtime_config.translate_drums
         # Allow override of transposition
@@ -281,7 +283,8 @@ class MIDIConverter:
         tracks: Dict[str, InstrumentTrack],
         start_step: int = 0,
         num_steps: int = None,
-        include_note_off_at_end: bool = True
+        include_note_off_at_end: bool = True,
+        time_offset: float = 0.0
     ) -> List[tuple]:
         """
         Generate real-time MIDI messages for playback
@@ -289,15 +292,21 @@ class MIDIConverter:
             tracks: Dict mapping instrument name to InstrumentTrack
             start_step: Starting step index
             num_steps: Number of steps to generate (None = all)
+            time_offset: Seconds added to every message time (e.g. section start)
         Returns:
             List of (time_in_seconds, mido.Message) tuples
         """
         messages = []
 
-        # Calculate time per step in seconds
-        beats_per_second = self.tempo / 60.0
-        steps_per_beat = 4  # Fixed 16th-note resolution
-        time_per_step = 1.0 / (beats_per_second * steps_per_beat)
+        time_per_step = self.seconds_per_step
+
+        # Swing-adjusted onset of every step (plus the closing boundary),
+        # computed once and shared by all instruments
+        max_steps = max((len(track_data.steps) for track_data in tracks.values()), default=0)
+        step_times = [
+            time_offset + self._calculate_swing_time_seconds(step_idx, time_per_step)
+            for step_idx in range(max_steps + 1)
+        ]
 
         # Generate messages for each instrument
         for instrument_name, track_data in tracks.items():
@@ -307,20 +316,24 @@ class MIDIConverter:
             if instrument_name != 'DRUMS' and self.config.send_program_changes:
                 if instrument_name not in self._programs_sent:
                     program = self.config.programs.get(instrument_name, 0)
-                    messages.append((0.0, mido.Message('program_change', program=program, channel=channel)))
+                    messages.append((time_offset, mido.Message('program_change', program=program, channel=channel)))
                     self._programs_sent.add(instrument_name)
 
             # Determine step range
             end_step = len(track_data.steps) if num_steps is None else start_step + num_steps
             steps_to_process = track_data.steps[start_step:end_step]
 
+            # Silent track (only rests/ties): nothing to emit beyond the program change
+            if not any(step.notes for step in steps_to_process):
+                continue
+
             # Track active notes for tie support
             active_notes = {}  # pitch -> (velocity, start_time)
 
             # Generate note events
             for step_idx, step in enumerate(steps_to_process):
                 absolute_step = start_step + step_idx
-                step_time = self._calculate_swing_time_seconds(absolute_step, time_per_step)
+                step_time = step_times[absolute_step]
 
                 if step.is_tie:
                     # Tie: continue previous notes, don't emit any events
@@ -360,7 +373,7 @@ class MIDIConverter:
             # Turn off any remaining active notes at the end
             if active_notes and self.config.note_mode == 'trigger':
                 final_step = start_step + len(steps_to_process)
-                final_time = self._calculate_swing_time_seconds(final_step, time_per_step)
+                final_time = step_times[final_step]
                 for note_pitch in active_notes.keys():
                     messages.append((
                         final_time,
@@ -368,22 +381,15 @@ class MIDIConverter:
                     ))
 
         # Optionally schedule final note off to flush tail
-        if include_note_off_at_end:
-            final_time = 0.0
-            for instrument_steps in tracks.values():
-                final_time = max(final_time, len(instrument_steps.steps))
-            if final_time > 0:
-                beats_per_second = self.tempo / 60.0
-                steps_per_beat = 4
-                time_per_step = 1.0 / (beats_per_second * steps_per_beat)
-                tail_time = self._calculate_swing_time_seconds(int(final_time), time_per_step)
-                for instrument_name, track_data in tracks.items():
-                    channel = self.config.channels.get(instrument_name, 0)
-                    # CC 123 is the General MIDI "All Notes Off" controller
-                    messages.append((
-                        tail_time,
-                        mido.Message('control_change', control=123, value=0, channel=channel)
-                    ))
+        if include_note_off_at_end and max_steps > 0:
+            tail_time = step_times[max_steps]
+            for instrument_name, track_data in tracks.items():
+                channel = self.config.channels.get(instrument_name, 0)
+                # CC 123 is the General MIDI "All Notes Off" controller
+                messages.append((
+                    tail_time,
+                    mido.Message('control_change', control=123, value=0, channel=channel)
+                ))
 
         # Sort by time
         messages.sort(key=lambda x: (x[0], getattr(x[1], 'type', '')))
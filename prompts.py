@@ -1,12 +1,11 @@
 """Prompt builders for Infinite Jazz batched quartet generation."""
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
 
 from config import RuntimeConfig
 
 
-MINIMAL_FORMAT_EXAMPLE: List[str] = [
+MINIMAL_FORMAT_EXAMPLE: str = "\n".join((
     "FORMAT EXAMPLE (just syntax, not a musical suggestion):",
     "BASS",
     "1 C2:80     ← note + velocity",
@@ -22,7 +21,14 @@ MINIMAL_FORMAT_EXAMPLE: List[str] = [
     "",
     "SAX",
     "1 G4:75",
-]
+))
+
+
+_CONTEXT_BLOCK = (
+    "\n\nPREVIOUS SECTION:\n{previous_context}\n\n"
+    "Respond to what came before however you want - continue it, contrast it, or go somewhere completely new."
+)
+_DIRECTION_BLOCK = "\n\nPLAYER DIRECTION:\n{extra_prompt}"
 
 
 @dataclass
@@ -30,19 +36,16 @@ class PromptBuilder:
     """Build prompts for quartet generation with stylistic guidance."""
 
     config: RuntimeConfig
+    _template: str = field(init=False, repr=False)
 
-    def build_quartet_prompt(self, previous_context: str = "", extra_prompt: str = "") -> str:
-        """Construct the prompt for generating all instruments in one pass.
-
-        Args:
-            previous_context: Previous section for musical continuity
-            extra_prompt: Additional instructions to guide the generation
-        """
+    def __post_init__(self):
+        # Steps, bars, and tempo are fixed for the run, so render the static
+        # header/trailer once and leave only the per-section slots open.
         steps = self.config.total_steps
         bars = self.config.bars_per_generation
         tempo = self.config.tempo
 
-        prompt = [
+        header = [
             f"You are a jazz quartet generating {bars} bars of music.",
             "Output all 4 instruments in tracker format exactly as specified.",
             f"Approximate tempo: {tempo} BPM on a 16th-note grid.",
@@ -60,28 +63,11 @@ class PromptBuilder:
             "You are a jazz quartet improvising together. Make your own musical choices.",
             "Play what sounds good to you. Break patterns. Surprise yourself.",
             "Use space, dynamics, and rhythm however you want.",
+            "",
+            MINIMAL_FORMAT_EXAMPLE,
         ]
 
-        prompt.append("")
-        prompt.extend(MINIMAL_FORMAT_EXAMPLE)
-
-        if previous_context:
-            prompt.extend([
-                "",
-                "PREVIOUS SECTION:",
-                previous_context,
-                "",
-                "Respond to what came before however you want - continue it, contrast it, or go somewhere completely new.",
-            ])
-
-        if extra_prompt:
-            prompt.extend([
-                "",
-                "PLAYER DIRECTION:",
-                extra_prompt,
-            ])
-
-        prompt.extend([
+        trailer = [
             "",
             "OUTPUT REQUIREMENTS:",
             "1. First line must be: BASS",
@@ -94,6 +80,17 @@ class PromptBuilder:
             f"8. Follow with exactly {steps} numbered lines for sax",
             "",
             "Generate the tracker data now:",
-        ])
+        ]
 
-        return "\n".join(prompt)
+        self._template = "\n".join(header) + "{context}{direction}\n" + "\n".join(trailer)
+
+    def build_quartet_prompt(self, previous_context: str = "", extra_prompt: str = "") -> str:
+        """Construct the prompt for generating all instruments in one pass.
+
+        Args:
+            previous_context: Previous section for musical continuity
+            extra_prompt: Additional instructions to guide the generation
+        """
+        context = _CONTEXT_BLOCK.format(previous_context=previous_context) if previous_context else ""
+        direction = _DIRECTION_BLOCK.format(extra_prompt=extra_prompt) if extra_prompt else ""
+        return self._template.format(context=context, direction=direction)
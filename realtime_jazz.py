@@ -147,6 +147,11 @@ Examples:
         default='gm',
         help='MIDI hardware profile (default: gm for FluidSynth/software, tg33 for Yamaha TG-33)'
     )
+    parser.add_argument(
+        '--realtime-priority',
+        action='store_true',
+        help='Run the playback thread with realtime (SCHED_FIFO) priority; Linux only, needs CAP_SYS_NICE or rtprio limits'
+    )
     return parser
 
 
@@ -164,14 +169,16 @@ def main(argv: Optional[list[str]] = None):
         list_midi_ports()
         return
 
-    runtime_config = DEFAULT_CONFIG
+    # Collect overrides and apply them in one replace (one validation pass)
+    config_overrides = {}
     if args.hardware == 'tg33':
         from config import _tg33_programs
-        runtime_config = replace(runtime_config, programs=_tg33_programs(), translate_drums=True, transpose_octaves=1)
+        config_overrides.update(programs=_tg33_programs(), translate_drums=True, transpose_octaves=1)
     if args.bars is not None:
-        runtime_config = replace(runtime_config, bars_per_generation=args.bars)
+        config_overrides['bars_per_generation'] = args.bars
     if args.tempo is not None:
-        runtime_config = replace(runtime_config, tempo=args.tempo)
+        config_overrides['tempo'] = args.tempo
+    runtime_config = replace(DEFAULT_CONFIG, **config_overrides) if config_overrides else DEFAULT_CONFIG
 
     llm_options = LLMOptions(
         backend=args.llm_backend,
@@ -194,6 +201,7 @@ def main(argv: Optional[list[str]] = None):
         seed=args.seed,
         tracker_format=args.tracker_format,
         head=args.head,
+        realtime_priority=args.realtime_priority,
     )
 
     app = InfiniteJazzApp(
@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Tuple
+import sys
 import time
 
 from llm_interface import LLMInterface
-from generator import ContinuousGenerator, save_generated_section, concatenate_sections
+from generator import ContinuousGenerator, save_generated_section, append_section
 from prompts import PromptBuilder
 from midi_converter import MIDIConverter
 from config import RuntimeConfig
@@ -34,23 +35,27 @@ class RealtimeJazzGenerator:
         prompt_builder_factory=None,
         tracker_format: str = "block",
         chart=None,
+        realtime_priority: bool = False,
     ):
         self.llm = llm
         self.audio_backend = audio_backend
         self.config = runtime_config
+        # Config is frozen; bind the values the run loop reads every section
+        self._tempo = runtime_config.tempo
+        self._bars = runtime_config.bars_per_generation
+        self._total_steps = runtime_config.total_steps
         self.save_output = save_output
         self.output_dir = Path(output_dir)
         self.verbose = verbose
-        self.player = RealtimePlayer(audio_backend)
+        self.player = RealtimePlayer(audio_backend, realtime_priority=realtime_priority)
         self.context_steps = context_steps
         self.extra_prompt = extra_prompt
         self.prompt_style = prompt_style
         self.seed = seed
         self.tracker_format = tracker_format
 
-        self.run_timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-
         if self.save_output:
+            # Fail fast on an unusable output dir instead of after the session
             self.output_dir.mkdir(parents=True, exist_ok=True)
             print(f"Saving outputs to {self.output_dir}")
 
@@ -69,44 +74,69 @@ class RealtimeJazzGenerator:
         )
         self.prefill_delay = 0.5
         self.midi_converter = MIDIConverter(runtime_config)
+        # Share the converter's step length so section durations match message times exactly
+        self._time_per_step = self.midi_converter.seconds_per_step
+        self._max_ahead_ns = round(self.generator.buffer_size * self._total_steps * self._time_per_step * 1e9)
 
         self.is_running = False
-        self.all_sections = []
+        # Running concatenation of every played section (only filled when saving)
+        self.combined_tracks: Dict[str, InstrumentTrack] = {}
         self.section_count = 0
 
     def _schedule_section(
         self,
         tracks: Dict[str, InstrumentTrack],
-        start_time: float
+        start_time: float,
+        num_steps: Optional[int] = None
     ) -> Tuple[float, int]:
-        messages = self.midi_converter.create_realtime_messages(tracks)
-        scheduled: List[Tuple[float, object]] = [
-            (start_time + relative_time, message)
-            for relative_time, message in messages
-        ]
-        if scheduled:
-            self.player.schedule_messages(scheduled)
+        messages = self.midi_converter.create_realtime_messages(tracks, time_offset=start_time)
+        if messages:
+            self.player.schedule_messages(messages, presorted=True)
             if not self.player.is_playing:
                 self.player.play()
 
-        num_steps = len(next(iter(tracks.values())).steps) if tracks else 0
+        if num_steps is None:
+            num_steps = len(next(iter(tracks.values())).steps) if tracks else 0
         actual_duration = self._calculate_section_duration_from_steps(num_steps)
         return actual_duration, len(messages)
 
+    def _play_one_section(self, section_num: int, queued_ns: int, continue_buffering: bool) -> int:
+        """Pull the next buffered section, queue it at queued_ns, and return the new queue end (ns)."""
+        # Header first so anything get_next_section prints lands under it
+        sys.stdout.write(f"\n--- Section {section_num + 1} ---\n")
+        tracks = self.generator.get_next_section(continue_buffering=continue_buffering)
+        # Sections are only needed for the combined export at cleanup
+        if self.save_output:
+            append_section(self.combined_tracks, tracks)
+            self.section_count += 1
+
+        # The pipeline pads/truncates every section to total_steps
+        actual_duration, msg_count = self._schedule_section(tracks, queued_ns / 1e9, self._total_steps)
+
+        # One write for the scheduling report instead of a print per line
+        log_lines = [f"Queueing section {section_num + 1} for playback..."]
+        if self.verbose:
+            log_lines.append(f"  Added {msg_count} MIDI messages (duration {actual_duration:.2f}s)")
+        else:
+            log_lines.append(f"  Section duration {actual_duration:.2f}s")
+        sys.stdout.write("\n".join(log_lines) + "\n")
+
+        return queued_ns + round(actual_duration * 1e9)
+
     def _calculate_section_duration_from_steps(self, num_steps: int) -> float:
-        beats_per_second = self.config.tempo / 60.0
-        steps_per_beat = 4
-        time_per_step = 1.0 / (beats_per_second * steps_per_beat)
-        return num_steps * time_per_step
+        return num_steps * self._time_per_step
 
     def run(self, num_sections: Optional[int] = None):
-        print(f"\n{'='*60}")
-        print("Infinite Jazz - Real-time Quartet Generator")
-        print(f"{'='*60}")
-        print(f"Tempo: {self.config.tempo} BPM")
-        print("Resolution: 16th notes")
-        print(f"Bars per section: {self.config.bars_per_generation}")
-        print(f"{'='*60}\n")
+        banner = [
+            f"\n{'='*60}",
+            "Infinite Jazz - Real-time Quartet Generator",
+            f"{'='*60}",
+            f"Tempo: {self._tempo} BPM",
+            "Resolution: 16th notes",
+            f"Bars per section: {self._bars}",
+            f"{'='*60}\n",
+        ]
+        sys.stdout.write("\n".join(banner) + "\n")
 
         if num_sections is not None and num_sections <= 0:
             print("No sections requested; exiting.")
@@ -120,52 +150,46 @@ class RealtimeJazzGenerator:
             if self.prefill_delay > 0:
                 time.sleep(self.prefill_delay)
 
-            print(f"\n{'='*60}")
-            print("Starting playback... (Press Ctrl+C to stop)")
-            print(f"{'='*60}\n")
+            start_banner = [
+                f"\n{'='*60}",
+                "Starting playback... (Press Ctrl+C to stop)",
+                f"{'='*60}\n",
+            ]
+            sys.stdout.write("\n".join(start_banner) + "\n")
 
             self.is_running = True
             section_num = 0
-            queued_time = 0.0
-            playback_start_time = None
+            # Integer nanoseconds on the monotonic clock: no wall-clock jumps,
+            # no float drift in the queue end across long sessions
+            queued_ns = 0
 
             time.sleep(0.5)
-            playback_start_time = time.time()
+            playback_start_ns = time.monotonic_ns()
 
             while self.is_running:
                 if num_sections is not None and section_num >= num_sections:
                     break
 
-                wall_clock_elapsed = time.time() - playback_start_time
-                ahead_by = queued_time - wall_clock_elapsed
-                max_ahead = self.generator.buffer_size * self._calculate_section_duration_from_steps(
-                    self.config.total_steps
-                )
+                ahead_ns = queued_ns - (time.monotonic_ns() - playback_start_ns)
 
-                if ahead_by >= max_ahead:
+                if ahead_ns >= self._max_ahead_ns:
                     if self.verbose:
-                        print(f"Queued {ahead_by:.1f}s ahead (max {max_ahead:.1f}s), waiting...")
-                    time.sleep(0.5)
+                        print(f"Queued {ahead_ns / 1e9:.1f}s ahead (max {self._max_ahead_ns / 1e9:.1f}s), waiting...")
+                    # Playback drains at wall-clock rate: sleep exactly until we drop below max_ahead
+                    time.sleep((ahead_ns - self._max_ahead_ns) / 1e9)
                     continue
 
-                while len(self.generator.buffer) == 0:
+                if not self.generator.has_buffered_sections():
                     if self.verbose:
                         print("Buffer empty, waiting for generation...")
-                    time.sleep(0.1)
+                    # Block until the generator signals; stop waiting if nothing is
+                    # being generated (get_next_section then generates inline)
+                    while not self.generator.wait_for_section(timeout=1.0):
+                        if not self.generator.is_generating():
+                            break
 
-                print(f"\n--- Section {section_num + 1} ---")
                 should_continue = num_sections is None or (section_num + 1) < num_sections
-                tracks = self.generator.get_next_section(continue_buffering=should_continue)
-                self.all_sections.append(tracks)
-
-                print(f"Queueing section {section_num + 1} for playback...")
-                actual_duration, msg_count = self._schedule_section(tracks, queued_time)
-                if self.verbose:
-                    print(f"  Added {msg_count} MIDI messages (duration {actual_duration:.2f}s)")
-                else:
-                    print(f"  Section duration {actual_duration:.2f}s")
-
-                queued_time += actual_duration
+                queued_ns = self._play_one_section(section_num, queued_ns, should_continue)
                 section_num += 1
 
             print("\nFinishing playback...")
@@ -181,26 +205,29 @@ class RealtimeJazzGenerator:
 
         self.player.stop()
 
-        if self.save_output and self.all_sections:
-            print(f"\nSaving complete MIDI file ({len(self.all_sections)} sections)...")
-            combined_tracks = concatenate_sections(self.all_sections)
-
-            # Create a separate converter for MIDI file export (no drum translation or transposition for GM compatibility)
-            file_converter = MIDIConverter(self.midi_converter.config, translate_drums=False, transpose_octaves=0)
-            midi_file = file_converter.create_midi_file(combined_tracks)
-
-            midi_file_path = self.output_dir / f"complete_{self.run_timestamp}.mid"
-            midi_file.save(str(midi_file_path))
-            print(f"✓ Saved complete MIDI: {midi_file_path}")
-
-            txt_file_path = self.output_dir / f"complete_{self.run_timestamp}.txt"
-            save_generated_section(
-                combined_tracks,
-                str(txt_file_path),
-                metadata=self._build_metadata()
-            )
-
-        self.player.close()
+        try:
+            if self.save_output and self.combined_tracks:
+                print(f"\nSaving complete MIDI file ({self.section_count} sections)...")
+                run_timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                combined_tracks = self.combined_tracks
+
+                # Create a separate converter for MIDI file export (no drum translation or transposition for GM compatibility)
+                file_converter = MIDIConverter(self.midi_converter.config, translate_drums=False, transpose_octaves=0)
+                midi_file = file_converter.create_midi_file(combined_tracks)
+
+                midi_file_path = self.output_dir / f"complete_{run_timestamp}.mid"
+                midi_file.save(str(midi_file_path))
+                print(f"✓ Saved complete MIDI: {midi_file_path}")
+
+                txt_file_path = self.output_dir / f"complete_{run_timestamp}.txt"
+                save_generated_section(
+                    combined_tracks,
+                    str(txt_file_path),
+                    metadata=self._build_metadata()
+                )
+        finally:
+            # Always release the backend (e.g. FluidSynth process), even if export fails
+            self.player.close()
         print("Done!")
 
     def _build_metadata(self) -> Dict[str, str]:
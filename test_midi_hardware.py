@@ -13,10 +13,11 @@ Usage:
 import argparse
 import time
 import sys
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import mido
 
+from audio_output import enable_realtime_scheduling, REALTIME_PRIORITY
 from config import DEFAULT_CONFIG
 
 
@@ -33,6 +34,13 @@ class MIDIHardwareTester:
         """
         self.port = None
         self.config = DEFAULT_CONFIG
+        # CC#123 (All Notes Off) for every channel, built once and reused
+        self._all_notes_off_msgs = [
+            mido.Message('control_change', control=123, value=0, channel=channel)
+            for channel in range(16)
+        ]
+        # (channel, note) -> (note_on, note_off), filled on first use
+        self._note_msgs = {}
 
         # List available ports
         output_ports = mido.get_output_names()
@@ -76,10 +84,21 @@ class MIDIHardwareTester:
     def all_notes_off(self):
         """Send all notes off on all channels"""
         print("Sending all notes off...")
-        for channel in range(16):
-            self.port.send(mido.Message('control_change', control=123, value=0, channel=channel))
+        for message in self._all_notes_off_msgs:
+            self.port.send(message)
         time.sleep(0.1)
 
+    def _note_messages(self, channel: int, note: int) -> Tuple[mido.Message, mido.Message]:
+        """Return cached note_on/note_off messages for a channel and note"""
+        pair = self._note_msgs.get((channel, note))
+        if pair is None:
+            pair = (
+                mido.Message('note_on', note=note, velocity=100, channel=channel),
+                mido.Message('note_off', note=note, velocity=0, channel=channel),
+            )
+            self._note_msgs[(channel, note)] = pair
+        return pair
+
     def test_channel(self, channel: int, instrument_name: str, program: Optional[int] = None,
                      test_notes: List[int] = None, note_duration: float = 0.5):
         """
@@ -111,13 +130,14 @@ class MIDIHardwareTester:
         for note in test_notes:
             note_name = self._note_to_name(note)
             print(f"  Playing note {note} ({note_name})...")
+            note_on, note_off = self._note_messages(channel, note)
 
             # Note on
-            self.port.send(mido.Message('note_on', note=note, velocity=100, channel=channel))
+            self.port.send(note_on)
             time.sleep(note_duration)
 
             # Note off
-            self.port.send(mido.Message('note_off', note=note, velocity=0, channel=channel))
+            self.port.send(note_off)
             time.sleep(0.1)
 
         print(f"  ✓ {instrument_name} test complete")
@@ -145,9 +165,10 @@ class MIDIHardwareTester:
         print("\nTesting individual drums:")
         for drum_name, note in drum_tests:
             print(f"  Playing {drum_name} (note {note})...")
-            self.port.send(mido.Message('note_on', note=note, velocity=100, channel=drums_channel))
+            note_on, note_off = self._note_messages(drums_channel, note)
+            self.port.send(note_on)
             time.sleep(note_duration)
-            self.port.send(mido.Message('note_off', note=note, velocity=0, channel=drums_channel))
+            self.port.send(note_off)
             time.sleep(0.1)
 
         print("\nPlaying basic beat pattern...")
@@ -162,17 +183,18 @@ class MIDIHardwareTester:
             ('CLOSED_HH', 1.5),
         ]
 
-        start_time = time.time()
+        start_time = time.monotonic()
         for drum_name, beat_time in pattern:
-            note = drums_config[drum_name]
+            note_on, note_off = self._note_messages(drums_channel, drums_config[drum_name])
 
-            # Wait until beat time
-            while time.time() - start_time < beat_time:
-                time.sleep(0.001)
+            # Sleep once until beat time instead of spinning on 1 ms naps
+            remaining = start_time + beat_time - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
-            self.port.send(mido.Message('note_on', note=note, velocity=100, channel=drums_channel))
+            self.port.send(note_on)
             time.sleep(0.05)
-            self.port.send(mido.Message('note_off', note=note, velocity=0, channel=drums_channel))
+            self.port.send(note_off)
 
         time.sleep(0.5)
         print("  ✓ Drum test complete")
@@ -222,9 +244,10 @@ class MIDIHardwareTester:
             print(f"  Channel {channel} (1-indexed: Ch{channel+1})...", end='', flush=True)
 
             # Play kick
-            self.port.send(mido.Message('note_on', note=kick_note, velocity=100, channel=channel))
+            note_on, note_off = self._note_messages(channel, kick_note)
+            self.port.send(note_on)
             time.sleep(0.3)
-            self.port.send(mido.Message('note_off', note=kick_note, velocity=0, channel=channel))
+            self.port.send(note_off)
             time.sleep(0.5)
 
             if channel == 9:
@@ -287,9 +310,18 @@ Examples:
         action='store_true',
         help='Scan all 16 channels to find drum channel'
     )
+    parser.add_argument(
+        '--realtime-priority',
+        action='store_true',
+        help='Run under SCHED_FIFO for tighter note timing (Linux; needs CAP_SYS_NICE or rtprio limit)'
+    )
 
     args = parser.parse_args()
 
+    if args.realtime_priority:
+        if enable_realtime_scheduling():
+            print(f"Realtime scheduling enabled (SCHED_FIFO priority {REALTIME_PRIORITY})")
+
     try:
         # Create tester
         tester = MIDIHardwareTester(port_name=args.device, port_index=args.port)
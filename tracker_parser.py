@@ -4,18 +4,34 @@ Converts text tracker format to structured representation
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+# Patterns used on every note/line, compiled once at import
+_NOTE_NAME_RE = re.compile(r'^([A-G][#b]?)(-?\d+)$')
+_LINENUM_RE = re.compile(r'^\d+\.?\s+')
+_DIGITS_RE = re.compile(r'\d+')
+_CODE_FENCE_RE = re.compile(r'```[\w]*\n?')
+_BEAT_MARKER_RE = re.compile(r'^\[.*\]$')
+_INSTRUMENT_LINE_RE = re.compile(r'^(BASS|DRUMS|PIANO|SAX)\s*:\s*(.+)$')
+_INSTRUMENT_HEADERS = frozenset(('BASS', 'DRUMS', 'PIANO', 'SAX'))
+
+# Parsed data is created per note/step; drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Note:
     """Represents a single note with pitch and velocity"""
     pitch: int  # MIDI note number (0-127) or pitch name (e.g., "C4")
     velocity: int  # MIDI velocity (0-127)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TrackerStep:
     """Represents one time step in the tracker"""
     notes: List[Note]  # Empty list = rest
@@ -23,7 +39,7 @@ class TrackerStep:
     is_tie: bool = False  # True = continue previous note (^)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class InstrumentTrack:
     """Represents a complete track for one instrument"""
     instrument: str
@@ -41,31 +57,29 @@ class TrackerParser:
         'G': 7, 'G#': 8, 'Ab': 8, 'A': 9, 'A#': 10, 'Bb': 10,
         'B': 11, 'Cb': 11, 'B#': 0
     }
+    # Semitone offset from C of the written octave; Cb/B# cross the octave
+    # boundary (Cb4 = B3, B#3 = C4), so their octave shift is folded in
+    _PITCH_OFFSET = {**NOTE_MAP, 'Cb': -1, 'B#': 12}
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def note_to_midi(note_name: str) -> int:
         """
         Convert note name to MIDI number
         Examples: C4 -> 60, A#3 -> 58, Gb5 -> 78, Cb4 -> 59 (B3)
+
+        Memoized: only ~200 valid names exist, so steady-state parsing is a
+        cache hit. Invalid names raise and are never cached.
         """
-        match = re.match(r'^([A-G][#b]?)(-?\d+)$', note_name)
+        match = _NOTE_NAME_RE.match(note_name)
         if not match:
             raise ValueError(f"Invalid note name: {note_name}")
 
         note, octave = match.groups()
-        octave = int(octave)
-
-        # Handle enharmonic equivalents that cross octave boundaries
-        # Cb needs to go down an octave (Cb4 = B3)
-        # B# needs to go up an octave (B#3 = C4)
-        if note == 'Cb':
-            octave -= 1
-        elif note == 'B#':
-            octave += 1
 
         # MIDI note number = (octave + 1) * 12 + note_offset
         # Middle C (C4) = 60
-        midi_num = (octave + 1) * 12 + TrackerParser.NOTE_MAP[note]
+        midi_num = (int(octave) + 1) * 12 + TrackerParser._PITCH_OFFSET[note]
 
         if not 0 <= midi_num <= 127:
             raise ValueError(f"Note {note_name} out of MIDI range (0-127): {midi_num}")
@@ -90,8 +104,9 @@ class TrackerParser:
         entry = entry.strip()
 
         # Clean up common LLM mistakes: trailing commas, periods
-        entry = entry.rstrip('.,;')
-        entry = entry.strip()
+        # (only re-trim when there is punctuation to remove)
+        if entry.endswith(('.', ',', ';')):
+            entry = entry.rstrip('.,;').strip()
 
         # Check for tie notation
         if entry == '^':
@@ -108,15 +123,18 @@ class TrackerParser:
             if not note_str:
                 continue
 
-            if ':' not in note_str:
+            # One scan for the separator instead of a membership test plus split
+            pitch_str, sep, velocity_str = note_str.partition(':')
+            if not sep:
                 raise ValueError(f"Invalid note format (expected NOTE:VELOCITY): {note_str}")
 
-            pitch_str, velocity_str = note_str.split(':', 1)
-
             # Clean velocity string (might have trailing junk)
             velocity_str = velocity_str.strip()
-            # Extract just the digits
-            velocity_digits = ''.join(c for c in velocity_str if c.isdigit())
+            # Extract just the digits (usually the whole string already)
+            if velocity_str.isdigit():
+                velocity_digits = velocity_str
+            else:
+                velocity_digits = ''.join(_DIGITS_RE.findall(velocity_str))
 
             if not velocity_digits:
                 raise ValueError(f"No valid velocity found in: {velocity_str}")
@@ -132,11 +150,8 @@ class TrackerParser:
                 raise
             velocity = int(velocity_digits)
 
-            # Clamp velocity to valid MIDI range (0-127) instead of failing
-            if velocity < 0:
-                print(f"  Warning: Velocity {velocity} too low, clamping to 0")
-                velocity = 0
-            elif velocity > 127:
+            # Clamp velocity to MIDI max instead of failing (digits-only, so never negative)
+            if velocity > 127:
                 print(f"  Warning: Velocity {velocity} too high, clamping to 127")
                 velocity = 127
 
@@ -144,6 +159,19 @@ class TrackerParser:
 
         return (notes, False)
 
+    @staticmethod
+    def _parse_step_line(line: str) -> TrackerStep:
+        """Parse one stripped, non-comment tracker line into a step"""
+        # Strip line number if present (format: "1 C2:80" or "1. C2:80")
+        # Match optional number (with optional period) followed by whitespace;
+        # unnumbered lines (the usual LLM output) skip the regex entirely
+        if line[0].isdigit():
+            line = _LINENUM_RE.sub('', line)
+
+        notes, is_tie = TrackerParser.parse_note_entry(line)
+        is_rest = len(notes) == 0 and not is_tie
+        return TrackerStep(notes=notes, is_rest=is_rest, is_tie=is_tie)
+
     @staticmethod
     def parse_track(instrument: str, lines: List[str]) -> InstrumentTrack:
         """
@@ -161,14 +189,8 @@ class TrackerParser:
             if not line or line.startswith('#'):
                 continue
 
-            # Strip line number if present (format: "1 C2:80" or "1. C2:80")
-            # Match optional number (with optional period) followed by whitespace
-            line = re.sub(r'^\d+\.?\s+', '', line)
-
             try:
-                notes, is_tie = TrackerParser.parse_note_entry(line)
-                is_rest = len(notes) == 0 and not is_tie
-                steps.append(TrackerStep(notes=notes, is_rest=is_rest, is_tie=is_tie))
+                steps.append(TrackerParser._parse_step_line(line))
             except ValueError as e:
                 raise ValueError(f"Error in {instrument} track, line {line_num}: {e}")
 
@@ -193,12 +215,13 @@ class TrackerParser:
 
         Note: Line numbers are optional and will be automatically stripped if present.
         """
-        lines = tracker_text.strip().split('\n')
         tracks = {}
-        current_instrument = None
-        current_lines = []
+        current_track = None
+        line_num = 0
 
-        for line in lines:
+        # Steps are parsed as lines are read; a track is registered once it
+        # has its first step, so headers without data produce no track
+        for line in tracker_text.strip().split('\n'):
             line = line.strip()
 
             # Skip comment lines anywhere in the file
@@ -206,26 +229,21 @@ class TrackerParser:
                 continue
 
             # Check if this is a section header
-            if line in ['BASS', 'DRUMS', 'PIANO', 'SAX']:
-                # Save previous instrument if exists
-                if current_instrument and current_lines:
-                    tracks[current_instrument] = TrackerParser.parse_track(
-                        current_instrument, current_lines
-                    )
-
+            if line in _INSTRUMENT_HEADERS:
                 # Start new instrument
-                current_instrument = line
-                current_lines = []
+                current_track = InstrumentTrack(instrument=line, steps=[])
+                line_num = 0
             elif line:  # Non-empty line, not a header
-                if current_instrument is None:
+                if current_track is None:
                     raise ValueError(f"Found note data before instrument header: {line}")
-                current_lines.append(line)
-
-        # Don't forget the last instrument
-        if current_instrument and current_lines:
-            tracks[current_instrument] = TrackerParser.parse_track(
-                current_instrument, current_lines
-            )
+                line_num += 1
+                try:
+                    step = TrackerParser._parse_step_line(line)
+                except ValueError as e:
+                    raise ValueError(f"Error in {current_track.instrument} track, line {line_num}: {e}")
+                if not current_track.steps:
+                    tracks[current_track.instrument] = current_track
+                current_track.steps.append(step)
 
         return tracks
 
@@ -256,18 +274,18 @@ class TrackerParser:
         }
 
         # Clean up markdown/unicode
-        text = re.sub(r'```[\w]*\n?', '', text)
+        text = _CODE_FENCE_RE.sub('', text)
         text = text.replace('\u266f', '#').replace('\u266d', 'b')
 
         for line in text.strip().split('\n'):
             line = line.strip()
 
             # Skip empty lines, comments, beat markers
-            if not line or line.startswith('#') or re.match(r'^\[.*\]$', line):
+            if not line or line.startswith('#') or _BEAT_MARKER_RE.match(line):
                 continue
 
             # Match instrument lines: "BASS: C2:80 . . ."
-            m = re.match(r'^(BASS|DRUMS|PIANO|SAX)\s*:\s*(.+)$', line)
+            m = _INSTRUMENT_LINE_RE.match(line)
             if not m:
                 continue
 
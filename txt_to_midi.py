@@ -7,16 +7,25 @@ Usage: python txt_to_midi.py input.txt [output.mid]
 
 import argparse
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 from dataclasses import replace
 
 from tracker_parser import parse_tracker
 from midi_converter import MIDIConverter
-from generator import concatenate_sections
+from generator import append_section
 from config import DEFAULT_CONFIG, RuntimeConfig
 
 
+def _read_text(path: str) -> str:
+    """Read a tracker text file"""
+    with open(path, 'r') as f:
+        return f.read()
+
+
 def convert_txt_to_midi(
     input_files: list,
     output_file: str = None,
@@ -42,34 +51,50 @@ def convert_txt_to_midi(
         else:
             output_file = "combined.mid"
 
-    # Read and parse all input files
-    all_sections = []
+    # Check every input up front so a bad path fails before any reads start
     for input_file in input_files:
-        input_path = Path(input_file)
-
-        if not input_path.exists():
+        if not Path(input_file).exists():
             print(f"Error: File not found: {input_file}")
             sys.exit(1)
 
-        # Read tracker text
-        print(f"Reading {input_file}...")
-        with open(input_file, 'r') as f:
-            tracker_text = f.read()
-
-        # Parse tracker format
-        try:
-            tracks = parse_tracker(tracker_text)
-            all_sections.append(tracks)
-        except Exception as e:
-            print(f"Error parsing {input_file}: {e}")
-            sys.exit(1)
-
-    # Concatenate all sections if multiple files
-    if len(all_sections) > 1:
-        print(f"Concatenating {len(all_sections)} sections...")
-        combined_tracks = concatenate_sections(all_sections)
-    else:
-        combined_tracks = all_sections[0]
+    # Read files on a small thread pool (I/O releases the GIL) while parsing
+    # in order here; each section is appended onto the running combined
+    # tracks so parsed sections can be dropped right away
+    concatenate = len(input_files) > 1
+    if concatenate:
+        print(f"Concatenating {len(input_files)} sections...")
+    combined_tracks = {}
+    max_workers = min(8, len(input_files))
+    # Only a small window of reads is in flight, so memory stays bounded
+    # no matter how many files are concatenated
+    read_window = max_workers * 2
+    pending_files = iter(input_files)
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for input_file in islice(pending_files, read_window):
+            in_flight.append((input_file, pool.submit(_read_text, input_file)))
+
+        while in_flight:
+            input_file, read_future = in_flight.popleft()
+            tracker_text = read_future.result()
+            # Keep the window full while this file is parsed
+            next_file = next(pending_files, None)
+            if next_file is not None:
+                in_flight.append((next_file, pool.submit(_read_text, next_file)))
+
+            print(f"Parsing {input_file}...")
+
+            # Parse tracker format
+            try:
+                tracks = parse_tracker(tracker_text)
+            except Exception as e:
+                print(f"Error parsing {input_file}: {e}")
+                sys.exit(1)
+
+            if concatenate:
+                append_section(combined_tracks, tracks)
+            else:
+                combined_tracks = tracks
 
     # Convert to MIDI
     print("Converting to MIDI...")
@@ -84,7 +109,7 @@ def convert_txt_to_midi(
     midi_file.save(str(output_file))
 
     print(f"✓ Successfully converted to MIDI!")
-    print(f"  Sections: {len(all_sections)}")
+    print(f"  Sections: {len(input_files)}")
     print(f"  Tempo: {midi_tempo} BPM")
     print(f"  Tracks: {len(combined_tracks)}")
     print(f"  Output: {output_file}")